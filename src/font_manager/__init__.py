@@ -15,11 +15,12 @@ Usage
 from __future__ import annotations
 
 import logging
-from typing import Callable
+from typing import Callable, Sequence
 
 from .models import FontInfo
 from .discovery import discover_fonts
 from .metadata import extract_all_metadata
+from .filters import clear_columns_cache, set_columns_source
 from .filters import filter_fonts as _filter_fonts
 
 __all__ = [
@@ -34,18 +35,97 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 # ── Module-level cache ─────────────────────────────────────────
-_cache: list[FontInfo] | None = None
+_cache: tuple[FontInfo, ...] | None = None
 _cache_latin_only: bool | None = None
+# Set by clear_cache(): the next scan re-parses every file instead of
+# trusting the on-disk cache.
+_refresh = False
+
+# Lowercased family / full name → indices into _cache (in sorted order)
+_family_index: dict[str, list[int]] = {}
+_fullname_index: dict[str, list[int]] = {}
+# Lowercased full names aligned with _cache, and a lazily built
+# character-trigram → indices inverted index over them.
+_all_fullnames_lc: tuple[str, ...] = ()
+_trigram_index: dict[str, set[int]] | None = None
+# Sorted unique family names of _cache (built on first request)
+_families: tuple[str, ...] | None = None
 
 
 def clear_cache() -> None:
-    """Clear the cached font list, forcing a re-scan on next call."""
-    global _cache, _cache_latin_only
+    """
+    Clear the cached font list, forcing a re-scan on next call.
+
+    The next scan also re-parses every font file rather than reusing the
+    on-disk cache (whose entries it then replaces).
+    """
+    global _cache, _cache_latin_only, _family_index, _fullname_index
+    global _all_fullnames_lc, _trigram_index, _families, _refresh
     _cache = None
     _cache_latin_only = None
+    _refresh = True
+    _family_index = {}
+    _fullname_index = {}
+    _all_fullnames_lc = ()
+    _trigram_index = None
+    _families = None
+    clear_columns_cache()
+
+
+def _build_indexes(fonts: Sequence[FontInfo]) -> None:
+    """Rebuild the name → indices lookup tables for the cached font list."""
+    global _family_index, _fullname_index, _all_fullnames_lc, _trigram_index
+    global _families
+    _family_index = {}
+    _fullname_index = {}
+    for i, f in enumerate(fonts):
+        _family_index.setdefault(f._family_lc, []).append(i)
+        _fullname_index.setdefault(f._full_name_lc, []).append(i)
+    _all_fullnames_lc = tuple(f._full_name_lc for f in fonts)
+    _trigram_index = None
+    _families = None
+
+
+def _trigrams(s: str) -> set[str]:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+def _find_fullname_substring(needle: str) -> int | None:
+    """
+    Return the lowest cache index whose full name contains ``needle``.
 
+    Needles of 3+ characters are answered from the trigram index (built on
+    first use): candidate indices are those containing every trigram of the
+    needle, each verified with a final ``in`` check.
+    """
+    global _trigram_index
+    if len(needle) < 3:
+        for i, s in enumerate(_all_fullnames_lc):
+            if needle in s:
+                return i
+        return None
+
+    if _trigram_index is None:
+        _trigram_index = {}
+        for i, s in enumerate(_all_fullnames_lc):
+            for g in _trigrams(s):
+                _trigram_index.setdefault(g, set()).add(i)
+
+    postings = []
+    for g in _trigrams(needle):
+        posting = _trigram_index.get(g)
+        if not posting:
+            return None
+        postings.append(posting)
+    postings.sort(key=len)
+
+    for i in sorted(set.intersection(*postings)):
+        if needle in _all_fullnames_lc[i]:
+            return i
+    return None
 
-def get_all_fonts(latin_only: bool = True) -> list[FontInfo]:
+
+def get_all_fonts(latin_only: bool = True) -> tuple[FontInfo, ...]:
     """
     Discover all fonts matplotlib can use and extract their full metadata.
 
@@ -57,42 +137,44 @@ def get_all_fonts(latin_only: bool = True) -> list[FontInfo]:
 
     Returns
     -------
-    list[FontInfo]
-        Sorted list of font metadata objects.
+    tuple[FontInfo, ...]
+        Sorted, immutable sequence of font metadata objects.
 
     Notes
     -----
-    Results are cached in memory.  Call ``clear_cache()`` to force a
-    fresh scan (e.g. after installing new fonts).
+    Results are cached in memory and the same tuple is returned on every
+    call.  Call ``clear_cache()`` to force a fresh scan (e.g. after
+    installing new fonts).
     """
-    global _cache, _cache_latin_only
+    global _cache, _cache_latin_only, _refresh
 
     if _cache is not None and _cache_latin_only == latin_only:
-        return list(_cache)  # return a copy
+        return _cache
 
     logger.info("Scanning fonts (latin_only=%s) ...", latin_only)
 
     # Step 1: Discover font files via matplotlib
     discovered = discover_fonts()
 
-    # Step 2: Extract deep metadata via fontTools
-    all_fonts = extract_all_metadata(discovered)
-
-    # Step 3: Optionally filter to Latin-only
-    if latin_only:
-        all_fonts = [f for f in all_fonts if f.supports_latin]
+    # Step 2: Extract deep metadata via fontTools, dropping non-Latin fonts
+    # (if requested) and sorting in the same pass
+    all_fonts = extract_all_metadata(
+        discovered, latin_only=latin_only, refresh=_refresh
+    )
+    _refresh = False
 
-    # Step 4: Sort and cache
-    all_fonts.sort()
-    _cache = all_fonts
+    # Step 3: Cache
+    _cache = tuple(all_fonts)
     _cache_latin_only = latin_only
+    _build_indexes(_cache)
+    set_columns_source(_cache)
 
-    logger.info("Font scan complete: %d fonts available", len(all_fonts))
-    return list(_cache)
+    logger.info("Font scan complete: %d fonts available", len(_cache))
+    return _cache
 
 
 def filter_fonts(
-    fonts: list[FontInfo] | None = None,
+    fonts: Sequence[FontInfo] | None = None,
     *,
     family: str | None = None,
     family_contains: str | None = None,
@@ -114,12 +196,18 @@ def filter_fonts(
     """
     Filter fonts by any combination of criteria.
 
-    If ``fonts`` is None, automatically calls ``get_all_fonts()`` first.
+    If ``fonts`` is None, automatically calls ``get_all_fonts()`` first;
+    ``family`` / ``full_name`` queries are then narrowed via the cached name
+    index before the remaining criteria are applied.
 
     See ``filters.filter_fonts`` for full parameter documentation.
     """
     if fonts is None:
         fonts = get_all_fonts()
+        if full_name is not None:
+            fonts = [_cache[i] for i in _fullname_index.get(full_name.lower(), ())]
+        elif family is not None:
+            fonts = [_cache[i] for i in _family_index.get(family.lower(), ())]
 
     return _filter_fonts(
         fonts,
@@ -156,9 +244,11 @@ def get_font_families(latin_only: bool = True) -> list[str]:
     list[str]
         Unique, sorted family names.
     """
+    global _families
     fonts = get_all_fonts(latin_only=latin_only)
-    families = sorted({f.family for f in fonts})
-    return families
+    if _families is None:
+        _families = tuple(sorted({f.family for f in fonts}))
+    return list(_families)
 
 
 def get_font_by_name(name: str) -> FontInfo | None:
@@ -169,22 +259,19 @@ def get_font_by_name(name: str) -> FontInfo | None:
 
     Returns None if not found.
     """
-    fonts = get_all_fonts()
+    get_all_fonts()  # ensure the cache and name indexes are populated
     name_lower = name.lower()
 
     # Exact match on full_name
-    for f in fonts:
-        if f.full_name.lower() == name_lower:
-            return f
+    hits = _fullname_index.get(name_lower)
+    if hits:
+        return _cache[hits[0]]
 
     # Exact match on family (return first variant)
-    for f in fonts:
-        if f.family.lower() == name_lower:
-            return f
+    hits = _family_index.get(name_lower)
+    if hits:
+        return _cache[hits[0]]
 
     # Substring match on full_name (return first)
-    for f in fonts:
-        if name_lower in f.full_name.lower():
-            return f
-
-    return None
+    hit = _find_fullname_substring(name_lower)
+    return None if hit is None else _cache[hit]
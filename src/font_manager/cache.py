@@ -0,0 +1,96 @@
+"""
+Persistent on-disk cache of extracted font metadata.
+
+Parsing font files is by far the most expensive part of a scan, yet font
+files rarely change.  Extracted ``FontInfo`` objects are therefore pickled
+per file, keyed by ``(st_mtime_ns, st_size)``, so later processes only need
+to ``stat()`` each file instead of re-parsing it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from .models import FontInfo, reintern
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever FontInfo (or the payload layout) changes shape, so that
+# stale pickles are discarded instead of producing broken objects.  Also
+# bump when extraction behaviour changes (e.g. how supports_latin or the
+# weight name is derived): entries keyed by an unchanged file would
+# otherwise keep the old results indefinitely.
+_CACHE_VERSION = 6
+
+# {file_path: (st_mtime_ns, st_size, [FontInfo, ...])}
+CacheEntries = dict[str, tuple[int, int, list[FontInfo]]]
+
+
+def cache_path() -> Path:
+    """
+    Return the location of the cache file.
+
+    Honours ``$XDG_CACHE_HOME``; defaults to ``~/.cache/font_manager/fonts.pkl``.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "font_manager" / "fonts.pkl"
+
+
+def load_cache() -> CacheEntries:
+    """
+    Load cached entries from disk.
+
+    Returns an empty dict if the file is missing, unreadable, corrupt, or
+    was written by a different cache version.
+    """
+    path = cache_path()
+    try:
+        with open(path, "rb") as fh:
+            payload = pickle.load(fh)
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        logger.debug("Ignoring unreadable font cache %s: %s", path, exc)
+        return {}
+
+    if not isinstance(payload, dict) or payload.get("version") != _CACHE_VERSION:
+        logger.debug("Ignoring font cache %s with mismatched version", path)
+        return {}
+    entries = payload.get("entries", {})
+    for _, _, fonts in entries.values():
+        reintern(fonts)
+    return entries
+
+
+def save_cache(entries: CacheEntries) -> None:
+    """
+    Write entries to disk atomically (temp file + ``os.replace``).
+
+    Failures are logged and otherwise ignored — the cache is an optimisation.
+    """
+    path = cache_path()
+    payload = {"version": _CACHE_VERSION, "entries": entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".fonts-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception as exc:
+        logger.warning("Failed to write font cache %s: %s", path, exc)
+
+
+def clear_disk_cache() -> None:
+    """Delete the cache file, if present."""
+    try:
+        cache_path().unlink()
+    except FileNotFoundError:
+        pass
@@ -5,10 +5,11 @@ Font discovery: find all font files that matplotlib can use.
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
-from matplotlib.font_manager import fontManager
+from matplotlib.font_manager import FontEntry, fontManager
 
 logger = logging.getLogger(__name__)
 
@@ -21,45 +22,87 @@ class DiscoveredFont:
     matplotlib_family: str
     matplotlib_style: str   # "normal", "italic", "oblique"
     matplotlib_weight: str | int  # e.g. "bold", 400, 700
+    mtime_ns: int = 0             # st_mtime_ns, used to validate the disk cache
+    size: int = 0                 # st_size, used to validate the disk cache
 
     @property
     def matplotlib_name(self) -> str:
         return self.matplotlib_family
 
 
+_FONT_SUFFIXES = (".ttf", ".otf", ".ttc", ".otc")
+
+
+def _list_directories(dirs: set[str]) -> dict[str, dict[str, os.DirEntry] | None]:
+    """
+    List each directory once with ``os.scandir``.
+
+    Maps directory → {file name: DirEntry}, or None if the directory could
+    not be listed (callers then fall back to a per-file ``os.stat``).
+    """
+    listings: dict[str, dict[str, os.DirEntry] | None] = {}
+    for d in dirs:
+        try:
+            with os.scandir(d or ".") as it:
+                listings[d] = {e.name: e for e in it}
+        except OSError:
+            listings[d] = None
+    return listings
+
+
 def discover_fonts() -> list[DiscoveredFont]:
     """
     Iterate matplotlib's font manager and return one DiscoveredFont per
     registered font file.
 
     Deduplicates by file path so each physical file appears only once.
+    Each kept file is stat'ed once (the stat also keys the disk cache).  On
+    Windows, where ``DirEntry.stat()`` is served from the directory listing,
+    one ``os.scandir`` per font directory replaces the per-file ``os.stat``.
     """
+    # Pass 1: unique TrueType / OpenType entries, grouped by directory
+    entries: list[FontEntry] = []
     seen_paths: set[str] = set()
-    results: list[DiscoveredFont] = []
-
     for entry in fontManager.ttflist:
         path_str = entry.fname
         if path_str in seen_paths:
             continue
         seen_paths.add(path_str)
 
-        path = Path(path_str)
-        if not path.exists():
-            logger.debug("Font file does not exist, skipping: %s", path)
+        # Only process TrueType / OpenType files
+        if not path_str.lower().endswith(_FONT_SUFFIXES):
+            logger.debug("Skipping non-TrueType/OpenType file: %s", path_str)
             continue
+        entries.append(entry)
 
-        # Only process TrueType / OpenType files
-        suffix = path.suffix.lower()
-        if suffix not in (".ttf", ".otf", ".ttc", ".otc"):
-            logger.debug("Skipping non-TrueType/OpenType file: %s", path)
+    # Only Windows gets DirEntry.stat() for free with the listing; elsewhere
+    # it is a syscall, so listing directories would only add work.
+    listings: dict[str, dict[str, os.DirEntry] | None] = {}
+    if os.name == "nt":
+        listings = _list_directories({os.path.dirname(e.fname) for e in entries})
+
+    # Pass 2: keep files that exist, recording their stat for the disk cache
+    results: list[DiscoveredFont] = []
+    for entry in entries:
+        path_str = entry.fname
+        listing = listings.get(os.path.dirname(path_str))
+        dir_entry = None if listing is None else listing.get(os.path.basename(path_str))
+        try:
+            # A name missing from the listing may still exist on a
+            # case-insensitive filesystem, so stat it directly.
+            st = os.stat(path_str) if dir_entry is None else dir_entry.stat()
+        except OSError:
+            logger.debug("Font file does not exist, skipping: %s", path_str)
             continue
 
         results.append(
             DiscoveredFont(
-                file_path=path,
+                file_path=Path(path_str),
                 matplotlib_family=entry.name,
                 matplotlib_style=entry.style,
                 matplotlib_weight=entry.weight,
+                mtime_ns=st.st_mtime_ns,
+                size=st.st_size,
             )
         )
 
@@ -7,13 +7,234 @@ and returns only the fonts matching ALL specified conditions.
 
 from __future__ import annotations
 
-from typing import Callable
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Sequence
+
+import numpy as np
 
 from .models import FontInfo
 
+# ── Columnar fast path ─────────────────────────────────────────
+# Inputs shorter than this are filtered with plain predicates: building the
+# NumPy columns would cost more than the vectorised comparisons save.
+_VECTORIZE_MIN_FONTS = 32
+
+# ── Predicate selectivity hints (lower runs first) ─────────────
+_SEL_EXACT  = 0   # exact family / full name / PostScript name
+_SEL_EQUAL  = 1   # exact weight, weight name, width class
+_SEL_RANGE  = 2   # weight bounds, family substring
+_SEL_FLAG   = 3   # boolean flags and format (~half the fonts match)
+_SEL_CUSTOM = 4   # arbitrary user code: always last
+
+
+@dataclass(frozen=True)
+class _FontColumns:
+    """Struct-of-arrays view of a font list, built once and reused."""
+
+    fonts: tuple[FontInfo, ...]
+    family_lc: np.ndarray        # object
+    full_name_lc: np.ndarray     # object
+    postscript_lc: np.ndarray    # object
+    weight_name_lc: np.ndarray   # object
+    format_lc: np.ndarray        # object
+    weight: np.ndarray           # int32 (usWeightClass is a uint16)
+    width_class: np.ndarray      # int32 (usWidthClass is a uint16)
+    is_bold: np.ndarray          # bool
+    is_italic: np.ndarray        # bool
+    is_oblique: np.ndarray       # bool
+    is_monospace: np.ndarray     # bool
+    supports_latin: np.ndarray   # bool
+    # Substring search support: unique lowercase family names joined into
+    # one NUL-separated blob, each name's start offset in it, and the
+    # unique-name index of every font.  ``family_blob`` is None if a name
+    # itself contains the separator.
+    family_blob: str | None
+    family_starts: list[int]
+    family_codes: np.ndarray     # intp
+
+
+_BLOB_SEP = "\0"
+
+
+def _build_columns(fonts: tuple[FontInfo, ...]) -> _FontColumns:
+    n = len(fonts)
+
+    def strings(attr: str) -> np.ndarray:
+        arr = np.empty(n, dtype=object)
+        arr[:] = [getattr(f, attr) for f in fonts]
+        return arr
+
+    def numbers(attr: str, dtype: type) -> np.ndarray:
+        return np.fromiter((getattr(f, attr) for f in fonts), dtype=dtype, count=n)
+
+    unique: dict[str, int] = {}
+    codes = np.fromiter(
+        (unique.setdefault(f._family_lc, len(unique)) for f in fonts),
+        dtype=np.intp,
+        count=n,
+    )
+    starts: list[int] = []
+    offset = 0
+    for name in unique:
+        starts.append(offset)
+        offset += len(name) + 1
+    blob = None
+    if not any(_BLOB_SEP in name for name in unique):
+        blob = _BLOB_SEP.join(unique)
+
+    return _FontColumns(
+        fonts=fonts,
+        family_lc=strings("_family_lc"),
+        full_name_lc=strings("_full_name_lc"),
+        postscript_lc=strings("_postscript_lc"),
+        weight_name_lc=strings("_weight_name_lc"),
+        format_lc=strings("_format_lc"),
+        weight=numbers("weight", np.int32),
+        width_class=numbers("width_class", np.int32),
+        is_bold=numbers("is_bold", np.bool_),
+        is_italic=numbers("is_italic", np.bool_),
+        is_oblique=numbers("is_oblique", np.bool_),
+        is_monospace=numbers("is_monospace", np.bool_),
+        supports_latin=numbers("supports_latin", np.bool_),
+        family_blob=blob,
+        family_starts=starts,
+        family_codes=codes,
+    )
+
+
+# Only the font tuple cached by get_all_fonts() gets a column view: it is
+# filtered again and again, whereas ad-hoc lists (e.g. the result of a
+# previous filter_fonts() call) would pay the build cost for one use.
+_columns_source: tuple[FontInfo, ...] | None = None
+_columns_cache: _FontColumns | None = None
+
+
+def set_columns_source(fonts: tuple[FontInfo, ...]) -> None:
+    """Register the cached font tuple (called from ``get_all_fonts()``)."""
+    global _columns_source, _columns_cache
+    _columns_source = fonts
+    _columns_cache = None
+
+
+def clear_columns_cache() -> None:
+    """Drop the cached columnar view (called from ``clear_cache()``)."""
+    global _columns_source, _columns_cache
+    _columns_source = None
+    _columns_cache = None
+
+
+def _get_columns(fonts: Sequence[FontInfo]) -> _FontColumns | None:
+    """
+    Return the column view if ``fonts`` is the registered source tuple
+    (built on first use), else None.
+    """
+    global _columns_cache
+    if fonts is not _columns_source:
+        return None
+    cols = _columns_cache
+    if cols is None:
+        cols = _columns_cache = _build_columns(_columns_source)
+    return cols
+
+
+# ── Fused predicate codegen ────────────────────────────────────
+# criterion → (selectivity hint, clause over font ``f`` and value ``{v}``)
+_CLAUSES: dict[str, tuple[int, str]] = {
+    "family":          (_SEL_EXACT,  "f._family_lc == {v}"),
+    "full_name":       (_SEL_EXACT,  "f._full_name_lc == {v}"),
+    "postscript_name": (_SEL_EXACT,  "f._postscript_lc == {v}"),
+    "weight":          (_SEL_EQUAL,  "f.weight == {v}"),
+    "weight_name":     (_SEL_EQUAL,  "f._weight_name_lc == {v}"),
+    "width_class":     (_SEL_EQUAL,  "f.width_class == {v}"),
+    "family_contains": (_SEL_RANGE,  "{v} in f._family_lc"),
+    "weight_min":      (_SEL_RANGE,  "f.weight >= {v}"),
+    "weight_max":      (_SEL_RANGE,  "f.weight <= {v}"),
+    "is_bold":         (_SEL_FLAG,   "f.is_bold == {v}"),
+    "is_italic":       (_SEL_FLAG,   "f.is_italic == {v}"),
+    "is_oblique":      (_SEL_FLAG,   "f.is_oblique == {v}"),
+    "is_monospace":    (_SEL_FLAG,   "f.is_monospace == {v}"),
+    "supports_latin":  (_SEL_FLAG,   "f.supports_latin == {v}"),
+    # Only a handful of distinct formats exist, so this rejects about as
+    # little as a style flag.
+    "format":          (_SEL_FLAG,   "f._format_lc == {v}"),
+    "custom":          (_SEL_CUSTOM, "{v}(f)"),
+}
+
+# Ordered criterion names → factory taking the criterion values and
+# returning the fused predicate.  Values are bound as arguments, never
+# formatted into the source.
+_predicate_factories: dict[tuple[str, ...], Callable[..., Callable[[FontInfo], bool]]] = {}
+
+
+def _compile_predicate(names: tuple[str, ...]) -> Callable[..., Callable[[FontInfo], bool]]:
+    """Generate and compile a predicate factory for the given criteria."""
+    params = [f"v{i}" for i in range(len(names))]
+    body = " and ".join(
+        _CLAUSES[name][1].format(v=param) for name, param in zip(names, params)
+    )
+    src = (
+        f"def _make({', '.join(params)}):\n"
+        f"    def _pred(f):\n"
+        f"        return {body}\n"
+        f"    return _pred\n"
+    )
+    env: dict[str, object] = {}
+    exec(compile(src, "<filter_fonts>", "exec"), env)
+    return env["_make"]
+
+
+# ── Substring search ───────────────────────────────────────────
+
+
+@lru_cache(maxsize=64)
+def _compile_substring(needle: str) -> re.Pattern[str]:
+    """Compile (once per needle) a literal-substring pattern."""
+    return re.compile(re.escape(needle))
+
+
+def _family_contains_mask(cols: _FontColumns, needle: str) -> np.ndarray:
+    """
+    Boolean mask of fonts whose lowercase family contains ``needle``.
+
+    Searches the blob of unique family names with one compiled pattern,
+    jumping to the next name after each hit, so the whole text is scanned
+    in C rather than with one ``in`` test per font.
+    """
+    blob = cols.family_blob
+    if blob is None or _BLOB_SEP in needle:
+        return np.fromiter(
+            (needle in s for s in cols.family_lc), dtype=bool, count=len(cols.fonts)
+        )
+
+    starts = cols.family_starts
+    hits = np.zeros(len(starts), dtype=bool)
+    search = _compile_substring(needle).search
+    pos = 0
+    while True:
+        m = search(blob, pos)
+        if m is None:
+            break
+        i = bisect_right(starts, m.start()) - 1
+        hits[i] = True
+        if i + 1 >= len(starts):
+            break
+        pos = starts[i + 1]
+    return hits[cols.family_codes]
+
+
+def _normalize_format(format: str) -> str:
+    """Lowercase a format filter and ensure it has a leading dot."""
+    _fmt = format.lower()
+    if not _fmt.startswith("."):
+        _fmt = "." + _fmt
+    return _fmt
+
 
 def filter_fonts(
-    fonts: list[FontInfo],
+    fonts: Sequence[FontInfo],
     *,
     # ── Identity filters ───────────────────────────────────────
     family: str | None = None,
@@ -45,8 +266,8 @@ def filter_fonts(
 
     Parameters
     ----------
-    fonts : list[FontInfo]
-        The font list to filter (e.g. from get_all_fonts()).
+    fonts : Sequence[FontInfo]
+        The fonts to filter (e.g. the tuple from get_all_fonts()).
     family : str, optional
         Exact match on the font family name (case-insensitive).
     family_contains : str, optional
@@ -76,76 +297,91 @@ def filter_fonts(
     Returns
     -------
     list[FontInfo]
-        Fonts matching ALL specified criteria, sorted naturally.
-    """
-    # Build a list of predicate functions from the provided criteria
-    predicates: list[Callable[[FontInfo], bool]] = []
-
-    # ── String matchers ────────────────────────────────────────
-    if family is not None:
-        _fam = family.lower()
-        predicates.append(lambda f, v=_fam: f.family.lower() == v)
-
-    if family_contains is not None:
-        _sub = family_contains.lower()
-        predicates.append(lambda f, v=_sub: v in f.family.lower())
-
-    if full_name is not None:
-        _fn = full_name.lower()
-        predicates.append(lambda f, v=_fn: f.full_name.lower() == v)
-
-    if postscript_name is not None:
-        _ps = postscript_name.lower()
-        predicates.append(lambda f, v=_ps: f.postscript_name.lower() == v)
-
-    if weight_name is not None:
-        _wn = weight_name.lower()
-        predicates.append(lambda f, v=_wn: f.weight_name.lower() == v)
-
-    # ── Boolean matchers ───────────────────────────────────────
-    if is_bold is not None:
-        predicates.append(lambda f, v=is_bold: f.is_bold == v)
+        Fonts matching ALL specified criteria, in input order.  Input from
+        ``get_all_fonts()`` is already sorted; call ``sorted()`` on the
+        result if you pass an unsorted list and need natural ordering.
 
-    if is_italic is not None:
-        predicates.append(lambda f, v=is_italic: f.is_italic == v)
-
-    if is_oblique is not None:
-        predicates.append(lambda f, v=is_oblique: f.is_oblique == v)
-
-    if is_monospace is not None:
-        predicates.append(lambda f, v=is_monospace: f.is_monospace == v)
-
-    if supports_latin is not None:
-        predicates.append(lambda f, v=supports_latin: f.supports_latin == v)
-
-    # ── Numeric matchers ───────────────────────────────────────
-    if weight is not None:
-        predicates.append(lambda f, v=weight: f.weight == v)
+    Notes
+    -----
+    Without a ``custom`` predicate, the tuple returned by ``get_all_fonts()``
+    is filtered as NumPy boolean masks over a cached column view of it.
+    """
+    cols = None
+    if custom is None and len(fonts) >= _VECTORIZE_MIN_FONTS:
+        cols = _get_columns(fonts)
+    if cols is not None:
+        mask = np.ones(len(cols.fonts), dtype=bool)
 
-    if weight_min is not None:
-        predicates.append(lambda f, v=weight_min: f.weight >= v)
+        # ── String columns ─────────────────────────────────────
+        if family is not None:
+            mask &= cols.family_lc == family.lower()
+        if family_contains is not None:
+            mask &= _family_contains_mask(cols, family_contains.lower())
+        if full_name is not None:
+            mask &= cols.full_name_lc == full_name.lower()
+        if postscript_name is not None:
+            mask &= cols.postscript_lc == postscript_name.lower()
+        if weight_name is not None:
+            mask &= cols.weight_name_lc == weight_name.lower()
+        if format is not None:
+            mask &= cols.format_lc == _normalize_format(format)
 
-    if weight_max is not None:
-        predicates.append(lambda f, v=weight_max: f.weight <= v)
+        # ── Boolean columns ────────────────────────────────────
+        if is_bold is not None:
+            mask &= cols.is_bold == is_bold
+        if is_italic is not None:
+            mask &= cols.is_italic == is_italic
+        if is_oblique is not None:
+            mask &= cols.is_oblique == is_oblique
+        if is_monospace is not None:
+            mask &= cols.is_monospace == is_monospace
+        if supports_latin is not None:
+            mask &= cols.supports_latin == supports_latin
 
-    if width_class is not None:
-        predicates.append(lambda f, v=width_class: f.width_class == v)
+        # ── Numeric columns ────────────────────────────────────
+        if weight is not None:
+            mask &= cols.weight == weight
+        if weight_min is not None:
+            mask &= cols.weight >= weight_min
+        if weight_max is not None:
+            mask &= cols.weight <= weight_max
+        if width_class is not None:
+            mask &= cols.width_class == width_class
 
-    # ── Format matcher ─────────────────────────────────────────
-    if format is not None:
-        _fmt = format.lower()
-        if not _fmt.startswith("."):
-            _fmt = "." + _fmt
-        predicates.append(lambda f, v=_fmt: f.format.lower() == v)
+        return [cols.fonts[i] for i in np.flatnonzero(mask)]
 
-    # ── Custom predicate ───────────────────────────────────────
-    if custom is not None:
-        predicates.append(custom)
+    # ── Fused predicate path ───────────────────────────────────
+    # Every active criterion becomes one clause of a single generated
+    # predicate.  Clauses are ordered by selectivity hint (lower hints are
+    # expected to reject more fonts) so the ``and`` chain short-circuits as
+    # early as possible.
+    criteria = {
+        "family": None if family is None else family.lower(),
+        "family_contains": None if family_contains is None else family_contains.lower(),
+        "full_name": None if full_name is None else full_name.lower(),
+        "postscript_name": None if postscript_name is None else postscript_name.lower(),
+        "weight_name": None if weight_name is None else weight_name.lower(),
+        "is_bold": is_bold,
+        "is_italic": is_italic,
+        "is_oblique": is_oblique,
+        "is_monospace": is_monospace,
+        "supports_latin": supports_latin,
+        "weight": weight,
+        "weight_min": weight_min,
+        "weight_max": weight_max,
+        "width_class": width_class,
+        "format": None if format is None else _normalize_format(format),
+        "custom": custom,
+    }
+    active = [name for name, value in criteria.items() if value is not None]
+    if not active:
+        return list(fonts)
 
-    # ── Apply all predicates (AND logic) ───────────────────────
-    if not predicates:
-        return sorted(fonts)
+    active.sort(key=lambda name: _CLAUSES[name][0])  # stable within a hint
+    names = tuple(active)
+    make = _predicate_factories.get(names)
+    if make is None:
+        make = _predicate_factories[names] = _compile_predicate(names)
+    pred = make(*(criteria[name] for name in names))
 
-    return sorted(
-        f for f in fonts if all(p(f) for p in predicates)
-    )
+    return [f for f in fonts if pred(f)]
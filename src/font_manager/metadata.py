@@ -8,14 +8,21 @@ and produces a fully-populated FontInfo object.
 from __future__ import annotations
 
 import logging
+import math
+import multiprocessing
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from fontTools.ttLib import TTFont
 
+from .cache import load_cache, save_cache
 from .discovery import DiscoveredFont
-from .models import FontInfo
+from .models import FontInfo, reintern
 from .utils import (
     extract_english_name,
+    get_table_data,
     is_latin_font,
     weight_class_to_name,
 )
@@ -34,6 +41,48 @@ _FS_OBLIQUE = 1 << 9   # bit 9
 _MAC_BOLD   = 1 << 0
 _MAC_ITALIC = 1 << 1
 
+# ── Raw table field layouts (big-endian, offsets from table start) ──
+_OS2_WEIGHT_WIDTH = struct.Struct(">HH")   # usWeightClass @4, usWidthClass @6
+_OS2_FS_SELECTION = struct.Struct(">H")    # fsSelection @62 (all versions)
+_HEAD_MAC_STYLE   = struct.Struct(">H")    # macStyle @44
+_POST_FIXED_PITCH = struct.Struct(">I")    # isFixedPitch @12
+
+# ── TTFont open options ─────────────────────────────────────────
+# lazy=True reads only the table directory up front; each table is read
+# from disk and decompiled on first access, so tables we never touch
+# (glyf, CFF, GSUB, GPOS, ...) cost nothing.  We never save, so skip the
+# bbox / timestamp bookkeeping, and tolerate tables that fail to decompile
+# (the getattr() defaults in _extract_single cover them).
+_OPEN_KWARGS = dict(
+    lazy=True,
+    recalcBBoxes=False,
+    recalcTimestamp=False,
+    ignoreDecompileErrors=True,
+)
+
+# ── Parallel extraction ────────────────────────────────────────
+# Below this many files the process-pool startup cost outweighs the gain.
+_PARALLEL_MIN_FILES = 16
+_PARALLEL_CHUNKSIZE = 8
+
+
+def _can_fork_pool() -> bool:
+    """
+    Return True if a process pool may be started from this process.
+
+    Only the "fork" start method is used: "spawn" and "forkserver" workers
+    re-import ``__main__``, which would re-run unguarded user scripts that
+    call ``get_all_fonts()`` at top level.  Daemonic processes may not have
+    children at all.  The default method is read from
+    ``get_all_start_methods()`` so the global context is not fixed.
+    """
+    if multiprocessing.current_process().daemon:
+        return False
+    method = multiprocessing.get_start_method(allow_none=True)
+    if method is None:
+        method = multiprocessing.get_all_start_methods()[0]
+    return method == "fork"
+
 
 def _extract_single(tt: TTFont, discovered: DiscoveredFont) -> FontInfo:
     """
@@ -56,21 +105,35 @@ def _extract_single(tt: TTFont, discovered: DiscoveredFont) -> FontInfo:
         family = typo_family
 
     # ── OS/2 table ─────────────────────────────────────────────
-    os2 = tt.get("OS/2")
+    # The numeric fields sit at fixed offsets, so read them straight from
+    # the raw table bytes; fall back to fontTools if those are unavailable.
     weight_class = 400
     width_class = 5
     fs_selection = 0
 
-    if os2 is not None:
-        weight_class = getattr(os2, "usWeightClass", 400) or 400
-        width_class  = getattr(os2, "usWidthClass", 5) or 5
-        fs_selection = getattr(os2, "fsSelection", 0) or 0
+    os2_data = get_table_data(tt, "OS/2")
+    if os2_data is not None and len(os2_data) >= 64:
+        weight_class, width_class = _OS2_WEIGHT_WIDTH.unpack_from(os2_data, 4)
+        (fs_selection,) = _OS2_FS_SELECTION.unpack_from(os2_data, 62)
+    else:
+        os2 = tt.get("OS/2")
+        if os2 is not None:
+            weight_class   = getattr(os2, "usWeightClass", 400)
+            width_class    = getattr(os2, "usWidthClass", 5)
+            fs_selection   = getattr(os2, "fsSelection", 0)
+    weight_class = weight_class or 400
+    width_class  = width_class or 5
+    fs_selection = fs_selection or 0
 
     # ── head table (fallback for style bits) ───────────────────
-    head = tt.get("head")
     mac_style = 0
-    if head is not None:
-        mac_style = getattr(head, "macStyle", 0) or 0
+    head_data = get_table_data(tt, "head")
+    if head_data is not None and len(head_data) >= 46:
+        (mac_style,) = _HEAD_MAC_STYLE.unpack_from(head_data, 44)
+    else:
+        head = tt.get("head")
+        if head is not None:
+            mac_style = getattr(head, "macStyle", 0) or 0
 
     # ── Determine bold / italic / oblique ──────────────────────
     is_bold    = bool(fs_selection & _FS_BOLD)    or bool(mac_style & _MAC_BOLD)
@@ -78,10 +141,14 @@ def _extract_single(tt: TTFont, discovered: DiscoveredFont) -> FontInfo:
     is_oblique = bool(fs_selection & _FS_OBLIQUE)
 
     # ── Monospace detection (post table) ───────────────────────
-    post = tt.get("post")
     is_monospace = False
-    if post is not None:
-        is_monospace = bool(getattr(post, "isFixedPitch", 0))
+    post_data = get_table_data(tt, "post")
+    if post_data is not None and len(post_data) >= 16:
+        is_monospace = bool(_POST_FIXED_PITCH.unpack_from(post_data, 12)[0])
+    else:
+        post = tt.get("post")
+        if post is not None:
+            is_monospace = bool(getattr(post, "isFixedPitch", 0))
 
     # ── Latin support ──────────────────────────────────────────
     supports_latin = is_latin_font(tt)
@@ -125,30 +192,36 @@ def extract_metadata(discovered: DiscoveredFont) -> list[FontInfo]:
             from fontTools.ttLib import TTCollection
 
             try:
-                collection = TTCollection(str(path))
-                for i, tt in enumerate(collection.fonts):
-                    try:
-                        info = _extract_single(tt, discovered)
-                        results.append(info)
-                    except Exception as exc:
-                        logger.warning(
-                            "Failed to extract sub-font %d from %s: %s", i, path, exc
-                        )
-                collection.close()
+                collection = TTCollection(str(path), **_OPEN_KWARGS)
+                try:
+                    for i, tt in enumerate(collection.fonts):
+                        try:
+                            info = _extract_single(tt, discovered)
+                            results.append(info)
+                        except Exception as exc:
+                            logger.warning(
+                                "Failed to extract sub-font %d from %s: %s", i, path, exc
+                            )
+                finally:
+                    collection.close()
             except Exception:
                 # Fallback: try opening as a regular TTFont with fontNumber=0
                 try:
-                    tt = TTFont(str(path), fontNumber=0)
-                    info = _extract_single(tt, discovered)
-                    results.append(info)
-                    tt.close()
+                    tt = TTFont(str(path), fontNumber=0, **_OPEN_KWARGS)
+                    try:
+                        info = _extract_single(tt, discovered)
+                        results.append(info)
+                    finally:
+                        tt.close()
                 except Exception as exc:
                     logger.warning("Failed to parse collection %s: %s", path, exc)
         else:
-            tt = TTFont(str(path))
-            info = _extract_single(tt, discovered)
-            results.append(info)
-            tt.close()
+            tt = TTFont(str(path), **_OPEN_KWARGS)
+            try:
+                info = _extract_single(tt, discovered)
+                results.append(info)
+            finally:
+                tt.close()
 
     except Exception as exc:
         logger.warning("Failed to open font file %s: %s", path, exc)
@@ -156,28 +229,118 @@ def extract_metadata(discovered: DiscoveredFont) -> list[FontInfo]:
     return results
 
 
+def _extract_many(discovered_fonts: list[DiscoveredFont]) -> list[list[FontInfo]]:
+    """
+    Run ``extract_metadata`` over every discovered font, in input order.
+
+    Large batches are fanned out over a forked process pool (parsing is
+    CPU-bound pure Python, so threads would serialise on the GIL), with no
+    more workers than there are chunks.  Small batches, and processes that
+    cannot fork a pool (see ``_can_fork_pool``), are handled serially.
+    """
+    if len(discovered_fonts) >= _PARALLEL_MIN_FILES and _can_fork_pool():
+        max_workers = min(
+            os.cpu_count() or 1,
+            math.ceil(len(discovered_fonts) / _PARALLEL_CHUNKSIZE),
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+            ) as ex:
+                results = list(
+                    ex.map(
+                        extract_metadata,
+                        discovered_fonts,
+                        chunksize=_PARALLEL_CHUNKSIZE,
+                    )
+                )
+            for fonts in results:
+                reintern(fonts)  # results arrive pickled
+            return results
+        except Exception as exc:
+            # OSError / BrokenProcessPool, NotImplementedError without
+            # sem_open, ...; extract_metadata itself never raises.
+            logger.warning("Parallel extraction unavailable, falling back to serial: %s", exc)
+
+    return [extract_metadata(d) for d in discovered_fonts]
+
+
 def extract_all_metadata(
     discovered_fonts: list[DiscoveredFont],
+    use_cache: bool = True,
+    latin_only: bool = False,
+    refresh: bool = False,
 ) -> list[FontInfo]:
     """
     Extract metadata for a list of discovered fonts.
     Skips fonts that fail to parse. Deduplicates by (full_name, file_size)
     to handle symlinks and multiple copies of the same font.
+
+    If ``use_cache`` is True, files whose (mtime, size) match the on-disk
+    cache are not re-parsed, and the cache is refreshed afterwards.  Files
+    that yield no fonts are not cached, so a transient failure (EMFILE,
+    EACCES, ...) does not hide them until the file changes.  ``refresh``
+    re-parses every discovered file while still updating the cache.
+
+    If ``latin_only`` is True, fonts without Latin support are dropped in
+    the same pass as deduplication.  The result is sorted by
+    ``FontInfo.sort_key``.
     """
+    cached = load_cache() if use_cache else {}
+    entries: dict[str, tuple[int, int, list[FontInfo]]] = {}
+    per_file: list[list[FontInfo] | None] = []
+    misses: list[DiscoveredFont] = []
+
+    for d in discovered_fonts:
+        key = str(d.file_path)
+        hit = None if refresh else cached.get(key)
+        if hit is not None and hit[0] == d.mtime_ns and hit[1] == d.size:
+            entries[key] = hit
+            per_file.append(hit[2])
+        else:
+            misses.append(d)
+            per_file.append(None)
+
+    extracted = iter(_extract_many(misses))
+    added = 0
+    for i, d in enumerate(discovered_fonts):
+        if per_file[i] is None:
+            fonts = next(extracted)
+            per_file[i] = fonts
+            if fonts:
+                entries[str(d.file_path)] = (d.mtime_ns, d.size, fonts)
+                added += 1
+
+    if use_cache:
+        # Keep entries for files this run did not discover (e.g. the
+        # mpl-data fonts of another environment sharing the cache) as long
+        # as they still exist; their (mtime, size) is checked when used.
+        discovered_paths = {str(d.file_path) for d in discovered_fonts}
+        for path, hit in cached.items():
+            if path not in discovered_paths and os.path.exists(path):
+                entries[path] = hit
+        if added or entries.keys() != cached.keys():
+            save_cache(entries)
+
     all_fonts: list[FontInfo] = []
     seen: set[tuple[str, str, int]] = set()  # (full_name, subfamily, weight)
 
-    for d in discovered_fonts:
-        fonts = extract_metadata(d)
+    for fonts in per_file:
         for f in fonts:
+            if latin_only and not f.supports_latin:
+                continue
             key = (f.full_name, f.subfamily, f.weight)
             if key not in seen:
                 seen.add(key)
                 all_fonts.append(f)
 
+    all_fonts.sort(key=FontInfo.sort_key)
+
     logger.info(
-        "Extracted metadata for %d unique font faces (from %d files)",
+        "Extracted metadata for %d unique font faces (from %d files, %d parsed)",
         len(all_fonts),
         len(discovered_fonts),
+        len(misses),
     )
     return all_fonts
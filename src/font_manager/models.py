@@ -4,18 +4,33 @@ Data models for font metadata.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, fields, asdict
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 
-@dataclass(frozen=True, order=True)
-class FontInfo:
+_INTERNED_FIELDS = (
+    "family", "subfamily", "weight_name", "format", "matplotlib_name",
+    "_family_lc", "_weight_name_lc", "_format_lc",
+)
+
+
+class _WeakrefSlots:
+    # Gives the slotted FontInfo a __weakref__ slot; dataclass(weakref_slot=)
+    # only exists from Python 3.11.
+    __slots__ = ("__weakref__",)
+
+
+@dataclass(frozen=True, slots=True)
+class FontInfo(_WeakrefSlots):
     """
     Immutable representation of a single font face and its metadata.
 
-    Ordering is by (family, weight, is_italic, is_bold) so that sorting
-    a list of FontInfo objects produces a natural grouping.
+    Ordering is by (family, weight, is_italic, is_bold), with the family
+    compared case-insensitively, so that sorting a list of FontInfo objects
+    produces a natural grouping.  Use ``FontInfo.sort_key`` as an explicit
+    ``key=`` for the fastest sorts.
     """
 
     # ── Identity ───────────────────────────────────────────────
@@ -45,17 +60,67 @@ class FontInfo:
     # ── Matplotlib integration ─────────────────────────────────
     matplotlib_name: str = ""    # name matplotlib uses to reference the font
 
+    # ── Precomputed lowercase keys (used by filters / lookups) ─
+    _family_lc: str = field(default="", init=False, repr=False, compare=False)
+    _full_name_lc: str = field(default="", init=False, repr=False, compare=False)
+    _postscript_lc: str = field(default="", init=False, repr=False, compare=False)
+    _weight_name_lc: str = field(default="", init=False, repr=False, compare=False)
+    _format_lc: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: bypass __setattr__ to fill the derived fields.
+        _set = object.__setattr__
+        _set(self, "_family_lc", self.family.lower())
+        _set(self, "_full_name_lc", self.full_name.lower())
+        _set(self, "_postscript_lc", self.postscript_name.lower())
+        _set(self, "_weight_name_lc", self.weight_name.lower())
+        _set(self, "_format_lc", self.format.lower())
+        self._intern_strings()
+
+    def _intern_strings(self) -> None:
+        # Low-cardinality strings are interned so the many faces sharing a
+        # family / subfamily / weight name / format share one string object.
+        for name in _INTERNED_FIELDS:
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
+    # ── Ordering ───────────────────────────────────────────────
+    def sort_key(self) -> tuple[str, int, bool, bool]:
+        """Return the natural sort key: (family, weight, is_italic, is_bold)."""
+        return (self._family_lc, self.weight, self.is_italic, self.is_bold)
+
+    # All four comparisons go through sort_key() so they stay mutually
+    # consistent; ``==`` remains the dataclass field-wise equality.
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, FontInfo):
+            return NotImplemented
+        return self.sort_key() < other.sort_key()
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, FontInfo):
+            return NotImplemented
+        return self.sort_key() <= other.sort_key()
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, FontInfo):
+            return NotImplemented
+        return self.sort_key() > other.sort_key()
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, FontInfo):
+            return NotImplemented
+        return self.sort_key() >= other.sort_key()
+
     # ── Convenience helpers ────────────────────────────────────
     def to_dict(self) -> dict[str, Any]:
         """Convert to a plain dict (Path becomes str)."""
-        d = asdict(self)
-        d["file_path"] = str(d["file_path"])
+        d = {name: getattr(self, name) for name in _FIELD_NAMES}
+        d["file_path"] = str(self.file_path)
         return d
 
     @classmethod
     def field_names(cls) -> list[str]:
         """Return the list of field names."""
-        return [f.name for f in fields(cls)]
+        return list(_FIELD_NAMES)
 
     def __str__(self) -> str:
         style_parts: list[str] = []
@@ -75,3 +140,20 @@ class FontInfo:
             f"FontInfo(family={self.family!r}, full_name={self.full_name!r}, "
             f"weight={self.weight}, is_bold={self.is_bold}, is_italic={self.is_italic})"
         )
+
+
+# Public (init) fields in declaration order, derived once from the dataclass;
+# this is also the key order of to_dict().
+_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in fields(FontInfo) if f.init)
+
+
+def reintern(fonts: Iterable[FontInfo]) -> None:
+    """
+    Re-intern the shared strings of unpickled FontInfo objects.
+
+    Unpickling (process-pool results, the disk cache) bypasses
+    ``__post_init__``, and a ``__setstate__`` hook cannot be relied on:
+    ``dataclass(slots=True, frozen=True)`` replaces it on Python 3.10.
+    """
+    for font in fonts:
+        font._intern_strings()
@@ -4,7 +4,13 @@ Utility helpers for font metadata extraction.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import struct
+import sys
+import weakref
+from array import array
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 if TYPE_CHECKING:
     from fontTools.ttLib import TTFont
@@ -22,6 +28,20 @@ WEIGHT_MAP: dict[int, str] = {
     800: "ExtraBold",
     900: "Black",
 }
+# Interned, so comparing names downstream is usually a pointer compare
+for _k in WEIGHT_MAP:
+    WEIGHT_MAP[_k] = sys.intern(WEIGHT_MAP[_k])
+del _k
+
+# Names of the uniform stops 100, 200, ..., 900, indexed by (stop // 100 - 1)
+_WEIGHT_NAMES: tuple[str, ...] = tuple(WEIGHT_MAP[w] for w in range(100, 1000, 100))
+
+# Name for every weight value 0..1000, precomputed so the common case is a
+# single tuple index.  Rounds to the closest stop; +49 (not +50) sends ties
+# to the lower stop.
+_WEIGHT_NAME_BY_VALUE: tuple[str, ...] = ("Unknown",) + tuple(
+    _WEIGHT_NAMES[max(0, min(8, (v + 49) // 100 - 1))] for v in range(1, 1001)
+)
 
 
 def weight_class_to_name(val: int) -> str:
@@ -29,12 +49,9 @@ def weight_class_to_name(val: int) -> str:
     Map an OS/2 usWeightClass integer (100-900) to a human-readable name.
     Values between standard stops are rounded to the nearest standard stop.
     """
-    if val <= 0:
-        return "Unknown"
-    # Find the closest standard weight
-    stops = sorted(WEIGHT_MAP.keys())
-    closest = min(stops, key=lambda s: abs(s - val))
-    return WEIGHT_MAP[closest]
+    if 0 <= val <= 1000:
+        return _WEIGHT_NAME_BY_VALUE[val]
+    return "Unknown" if val < 0 else _WEIGHT_NAMES[-1]
 
 
 # ── Width class → human-readable name ──────────────────────────
@@ -50,23 +67,130 @@ WIDTH_MAP: dict[int, str] = {
     8: "ExtraExpanded",
     9: "UltraExpanded",
 }
+for _k in WIDTH_MAP:
+    WIDTH_MAP[_k] = sys.intern(WIDTH_MAP[_k])
+del _k
+
+# Names indexed directly by width class (index 0 is unused)
+_WIDTH_NAMES: tuple[str, ...] = tuple(WIDTH_MAP.get(w, "Unknown") for w in range(10))
 
 
 def width_class_to_name(val: int) -> str:
     """Map an OS/2 usWidthClass integer (1-9) to a human-readable name."""
-    return WIDTH_MAP.get(val, "Unknown")
+    return _WIDTH_NAMES[val] if 1 <= val <= 9 else "Unknown"
+
+
+# ── Batch classification ───────────────────────────────────────
+
+# Index 0 of each table is "Unknown"; real names follow
+_WEIGHT_NAMES_ARR = np.array(("Unknown",) + _WEIGHT_NAMES, dtype=object)
+_WIDTH_NAMES_ARR = np.array(("Unknown",) + _WIDTH_NAMES[1:], dtype=object)
+
+
+def classify_weights_batch(vals: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ``weight_class_to_name`` over an array of usWeightClass values.
+
+    Returns an object array of names, element-wise identical to calling
+    ``weight_class_to_name`` on each value.
+    """
+    vals = np.asarray(vals, dtype=np.int64)
+    idx = np.clip((vals + 49) // 100, 1, 9)
+    idx[vals <= 0] = 0
+    return _WEIGHT_NAMES_ARR[idx]
+
+
+def classify_widths_batch(vals: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ``width_class_to_name`` over an array of usWidthClass values.
+    """
+    vals = np.asarray(vals, dtype=np.int64)
+    idx = np.where((vals >= 1) & (vals <= 9), vals, 0)
+    return _WIDTH_NAMES_ARR[idx]
+
+
+# ── Raw table access ───────────────────────────────────────────
+
+
+def get_table_data(tt: "TTFont", tag: str) -> bytes | None:
+    """
+    Return the raw bytes of an sfnt table without decompiling it.
+
+    Returns None if the table is absent, the font was not read from a file,
+    or the data cannot be read.
+    """
+    reader = getattr(tt, "reader", None)
+    if reader is None or tag not in reader.keys():
+        return None
+    try:
+        return reader[tag]
+    except Exception:
+        return None
 
 
 # ── English name extraction from the name table ───────────────
 
-# Priority order for finding English strings:
-#   1. Windows / Unicode BMP / English-US  (3, 1, 0x0409)
-#   2. Mac / Roman / English               (1, 0, 0)
-#   3. Unicode / any                        (0, *, 0)
-_PLATFORM_PRIORITY = [
-    (3, 1, 0x0409),   # Windows, Unicode BMP, en-US
-    (1, 0, 0),        # Macintosh, Roman, English
-]
+# Priority of (platformID, platEncID, langID) when picking the English
+# string (lower wins):
+#   0. Windows / Unicode BMP / English-US  (3, 1, 0x0409)
+#   1. Mac / Roman / English               (1, 0, 0)
+#   2. Unicode / any                       (0, *, *)
+#   3. anything else
+# Keys are (platformID, platEncID, langID) packed into one int as
+# platformID << 32 | platEncID << 16 | langID (each field is a uint16).
+_KEY_WIN_EN_US = 0x3_0001_0409   # Windows, Unicode BMP, en-US
+_KEY_MAC_EN    = 0x1_0000_0000   # Macintosh, Roman, English
+
+_PRIORITY: dict[int, int] = {
+    _KEY_WIN_EN_US: 0,
+    _KEY_MAC_EN: 1,
+}
+
+
+def _record_key(record) -> int:
+    return (record.platformID << 32) | (record.platEncID << 16) | record.langID
+
+
+def _record_priority(record) -> int:
+    return _PRIORITY.get(_record_key(record), 2 if record.platformID == 0 else 3)
+
+
+def _is_decodable(record) -> bool:
+    """
+    Cheap pre-check for records ``toUnicode()`` is bound to reject.
+
+    Only a missing string qualifies: fontTools recovers odd-length UTF-16
+    and similar damage itself, so those records must still be tried.
+    """
+    return getattr(record, "string", None) is not None
+
+
+def _name_index(name_table) -> tuple[dict[int, list], dict[tuple[int, int], Any]]:
+    """
+    Return two lookups over the table's name records, built on first use and
+    attached to the table as ``_name_index``:
+
+      - nameID → records (in table order)
+      - (nameID, packed key) → first decodable record with that key
+    """
+    index = getattr(name_table, "_name_index", None)
+    if index is None:
+        by_id: dict[int, list] = {}
+        by_key: dict[tuple[int, int], Any] = {}
+        for record in name_table.names:
+            by_id.setdefault(record.nameID, []).append(record)
+            if _is_decodable(record):
+                by_key.setdefault((record.nameID, _record_key(record)), record)
+        index = (by_id, by_key)
+        try:
+            name_table._name_index = index
+        except AttributeError:
+            pass
+    return index
+
+
+# Names shorter than this are interned (family / style names repeat a lot)
+_INTERN_MAX_LEN = 64
 
 
 def extract_english_name(name_table, name_id: int) -> str:
@@ -75,75 +199,371 @@ def extract_english_name(name_table, name_id: int) -> str:
 
     Falls back through platform priorities, then accepts the first available
     record for that nameID if no English-specific record is found.
+
+    Results are memoized in a ``_name_cache`` dict attached to the table, so
+    repeated lookups on the same font are O(1).  The cache assumes the
+    table's records are not modified afterwards.
     """
     if name_table is None:
         return ""
 
-    # First pass: check preferred platforms in order
-    for plat_id, enc_id, lang_id in _PLATFORM_PRIORITY:
-        for record in name_table.names:
-            if (
-                record.nameID == name_id
-                and record.platformID == plat_id
-                and record.platEncID == enc_id
-                and record.langID == lang_id
-            ):
-                try:
-                    return record.toUnicode()
-                except Exception:
-                    continue
-
-    # Second pass: any Unicode platform (platformID 0)
-    for record in name_table.names:
-        if record.nameID == name_id and record.platformID == 0:
-            try:
-                return record.toUnicode()
-            except Exception:
-                continue
+    cache = getattr(name_table, "_name_cache", None)
+    if cache is None:
+        cache = {}
+        try:
+            name_table._name_cache = cache
+        except AttributeError:
+            pass  # table does not accept attributes; just don't memoize
+    try:
+        return cache[name_id]
+    except KeyError:
+        pass
+    value = _find_english_name(name_table, name_id)
+    if len(value) < _INTERN_MAX_LEN:
+        value = sys.intern(value)
+    cache[name_id] = value
+    return value
 
-    # Third pass: take whatever is available
-    for record in name_table.names:
-        if record.nameID == name_id:
-            try:
-                return record.toUnicode()
-            except Exception:
-                continue
 
+def _find_english_name(name_table, name_id: int) -> str:
+    """Uncached body of ``extract_english_name``."""
+    by_id, by_key = _name_index(name_table)
+    records = by_id.get(name_id, ())
+
+    # The two preferred English records are direct probes; otherwise take
+    # the first well-formed Unicode-platform record, then the first of any.
+    best = by_key.get((name_id, _KEY_WIN_EN_US))
+    if best is None:
+        best = by_key.get((name_id, _KEY_MAC_EN))
+    if best is None:
+        best = next(
+            (r for r in records if r.platformID == 0 and _is_decodable(r)), None
+        )
+    if best is None:
+        best = next((r for r in records if _is_decodable(r)), None)
+
+    if best is None:
+        return ""
+    try:
+        return best.toUnicode()
+    except Exception:
+        pass
+
+    # Rare: the winner does not decode — try the others in priority order
+    ranked = sorted(
+        (
+            (_record_priority(r), i, r)
+            for i, r in enumerate(records)
+            if r is not best and _is_decodable(r)
+        ),
+        key=lambda t: t[:2],
+    )
+    for _, _, record in ranked:
+        try:
+            return record.toUnicode()
+        except Exception:
+            continue
     return ""
 
 
 # ── Latin support detection ────────────────────────────────────
 
 # Basic Latin codepoints: A-Z, a-z, 0-9, space, common punctuation
-_BASIC_LATIN_CODEPOINTS = set(range(0x0020, 0x007F))  # ASCII printable
-_REQUIRED_SAMPLE = set(range(0x0041, 0x005B)) | set(range(0x0061, 0x007B))  # A-Z + a-z
+_BASIC_LATIN_CODEPOINTS = frozenset(range(0x0020, 0x007F))  # ASCII printable
+_REQUIRED_SAMPLE = frozenset(range(0x0041, 0x005B)) | frozenset(range(0x0061, 0x007B))  # A-Z + a-z
+_SAMPLE_LO = min(_REQUIRED_SAMPLE)
+_SAMPLE_HI = max(_REQUIRED_SAMPLE)
+
+# Same (platformID, platEncID) preference order as TTFont.getBestCmap()
+_CMAP_PREFERENCES = ((3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0))
+
+_CMAP_HEADER = struct.Struct(">HH")          # version, numTables
+_CMAP_RECORD = struct.Struct(">HHL")         # platformID, encodingID, offset
+_CMAP4_HEADER = struct.Struct(">HHHHHHH")    # format, length, language, segCountX2, ...
+_CMAP12_HEADER = struct.Struct(">HHLLL")     # format, reserved, length, language, nGroups
+_CMAP12_GROUP = struct.Struct(">LLL")        # startCharCode, endCharCode, startGlyphID
+
+
+def _probe_cmap4(data: bytes, offset: int, length: int) -> bool | None:
+    """Return whether a format 4 subtable maps every sample codepoint."""
+    if length < _CMAP4_HEADER.size or (length - _CMAP4_HEADER.size) % 2:
+        return None
+    seg_count = _CMAP4_HEADER.unpack_from(data, offset)[3] // 2
+    codes = array("H")
+    codes.frombytes(data[offset + _CMAP4_HEADER.size : offset + length])
+    if sys.byteorder != "big":
+        codes.byteswap()
+    if len(codes) < 4 * seg_count + 1:
+        return None
+    end_code = codes[:seg_count]
+    start_code = codes[seg_count + 1 : 2 * seg_count + 1]
+    id_delta = codes[2 * seg_count + 1 : 3 * seg_count + 1]
+    id_range_offset = codes[3 * seg_count + 1 : 4 * seg_count + 1]
+    glyph_ids = codes[4 * seg_count + 1 :]
+
+    # fontTools rejects the whole subtable if any segment indexes outside
+    # the glyph array; leave such fonts to the slow path.
+    for i in range(seg_count - 1):
+        if id_range_offset[i] and start_code[i] <= end_code[i]:
+            partial = id_range_offset[i] // 2 - start_code[i] + i - seg_count
+            if start_code[i] + partial < 0 or end_code[i] + partial >= len(glyph_ids):
+                return None
+
+    # A codepoint is mapped if any segment gives it a non-zero glyph
+    # (the final 0xFFFF segment is ignored, as in fontTools).
+    mapped = set()
+    for i in range(seg_count - 1):
+        lo = max(start_code[i], _SAMPLE_LO)
+        hi = min(end_code[i], _SAMPLE_HI)
+        delta = id_delta[i]
+        partial = id_range_offset[i] // 2 - start_code[i] + i - seg_count
+        for cp in range(lo, hi + 1):
+            if cp in mapped or cp not in _REQUIRED_SAMPLE:
+                continue
+            if id_range_offset[i] == 0:
+                gid = (cp + delta) & 0xFFFF
+            else:
+                gid = glyph_ids[cp + partial]
+                gid = (gid + delta) & 0xFFFF if gid else 0
+            if gid:
+                mapped.add(cp)
+    return len(mapped) == len(_REQUIRED_SAMPLE)
+
+
+def _probe_cmap12(data: bytes, offset: int, length: int) -> bool | None:
+    """Return whether a format 12 subtable maps every sample codepoint."""
+    if length < _CMAP12_HEADER.size:
+        return None
+    n_groups = _CMAP12_HEADER.unpack_from(data, offset)[4]
+    if length != _CMAP12_HEADER.size + n_groups * _CMAP12_GROUP.size:
+        return None
+
+    # Mirror fontTools: skip inverted groups and groups starting before the
+    # previous accepted one ends; a group's start glyph 0 maps nothing for
+    # its first codepoint.  Groups are sorted, so stop past the sample.
+    mapped = set()
+    last_end = 0
+    for start, end, glyph in _CMAP12_GROUP.iter_unpack(
+        data[offset + _CMAP12_HEADER.size : offset + length]
+    ):
+        end = min(end, 0x10FFFF)
+        if start > end or start < last_end:
+            continue
+        last_end = end
+        if start > _SAMPLE_HI:
+            break
+        first = start + 1 if glyph == 0 else start
+        mapped.update(range(max(first, _SAMPLE_LO), min(end, _SAMPLE_HI) + 1))
+    return _REQUIRED_SAMPLE.issubset(mapped)
+
+
+def _probe_latin_cmap(data: bytes) -> bool | None:
+    """
+    Check the sample codepoints against the raw bytes of a cmap table.
+
+    Only the preferred Unicode subtable is read, and only the segments /
+    groups that can cover the sample are expanded — unlike getBestCmap(),
+    which materialises the whole mapping.  Returns None if the table uses
+    another subtable format or looks malformed, so the caller can fall back.
+    """
+    if len(data) < _CMAP_HEADER.size:
+        return None
+    num_tables = _CMAP_HEADER.unpack_from(data, 0)[1]
+    if _CMAP_HEADER.size + num_tables * _CMAP_RECORD.size > len(data):
+        return None
+
+    subtables: dict[tuple[int, int], tuple[int, int, int]] = {}
+    for plat_id, enc_id, offset in _CMAP_RECORD.iter_unpack(
+        data[_CMAP_HEADER.size : _CMAP_HEADER.size + num_tables * _CMAP_RECORD.size]
+    ):
+        if offset + 8 > len(data):
+            return None
+        fmt, length = struct.unpack_from(">HH", data, offset)
+        if fmt in (8, 10, 12, 13):
+            length = struct.unpack_from(">L", data, offset + 4)[0]
+        elif fmt == 14:
+            length = struct.unpack_from(">L", data, offset + 2)[0]
+        if not length:
+            continue  # fontTools skips zero-length subtables
+        if offset + length > len(data):
+            return None
+        subtables.setdefault((plat_id, enc_id), (fmt, offset, length))
+
+    for key in _CMAP_PREFERENCES:
+        found = subtables.get(key)
+        if found is None:
+            continue
+        fmt, offset, length = found
+        if fmt == 4:
+            return _probe_cmap4(data, offset, length)
+        if fmt == 12:
+            return _probe_cmap12(data, offset, length)
+        return None
+    return False  # no Unicode subtable at all
+
+
+# Raw OS/2 layouts (big-endian, offsets from table start)
+_OS2_VERSION = struct.Struct(">H")            # version @0
+_OS2_UNICODE_RANGES = struct.Struct(">IIII")  # ulUnicodeRange1-4 @42 (all versions)
+_OS2_CODEPAGE_RANGE1 = struct.Struct(">I")    # ulCodePageRange1 @78 (version 1+)
+
+
+def _read_os2_ranges(
+    tt: "TTFont",
+) -> tuple[int, int, tuple[int, int, int, int]] | None:
+    """
+    Return (version, ulCodePageRange1, (ulUnicodeRange1, ..., ulUnicodeRange4))
+    from the OS/2 table, or None if the font has none.
+
+    The fields are unpacked from the raw table bytes when the table has not
+    been decompiled yet; otherwise (or if the data is too short for its
+    version) the decompiled table object is used.
+    """
+    if "OS/2" not in getattr(tt, "tables", {}):
+        data = get_table_data(tt, "OS/2")
+        if data is not None and len(data) >= 58:
+            (version,) = _OS2_VERSION.unpack_from(data, 0)
+            if version == 0 or len(data) >= 82:
+                unicode_ranges = _OS2_UNICODE_RANGES.unpack_from(data, 42)
+                cp_range = 0
+                if version >= 1:
+                    (cp_range,) = _OS2_CODEPAGE_RANGE1.unpack_from(data, 78)
+                return version, cp_range, unicode_ranges
+
+    os2 = tt.get("OS/2")
+    if os2 is None:
+        return None
+    return (
+        getattr(os2, "version", 0),
+        getattr(os2, "ulCodePageRange1", 0),
+        (
+            getattr(os2, "ulUnicodeRange1", 0),
+            getattr(os2, "ulUnicodeRange2", 0),
+            getattr(os2, "ulUnicodeRange3", 0),
+            getattr(os2, "ulUnicodeRange4", 0),
+        ),
+    )
+
+
+# ── Script coverage from OS/2 ulUnicodeRange bits ──────────────
+
+# Script → bit number in the 128-bit ulUnicodeRange1-4 field (bit 32 is
+# ulUnicodeRange2 bit 0, and so on), per the OpenType OS/2 specification.
+_SCRIPT_BITS: dict[str, int] = {
+    "latin": 0,          # Basic Latin
+    "greek": 7,          # Greek and Coptic
+    "cyrillic": 9,       # Cyrillic
+    "armenian": 10,      # Armenian
+    "hebrew": 11,        # Hebrew
+    "arabic": 13,        # Arabic
+    "devanagari": 15,    # Devanagari
+    "bengali": 16,       # Bengali
+    "tamil": 20,         # Tamil
+    "thai": 24,          # Thai
+    "georgian": 26,      # Georgian
+    "hiragana": 49,      # Hiragana
+    "katakana": 50,      # Katakana
+    "hangul": 56,        # Hangul Syllables
+    "cjk": 59,           # CJK Unified Ideographs
+}
+
+
+def script_support(tt: "TTFont", script: str) -> bool:
+    """
+    Return whether the font's OS/2 table declares coverage of ``script``.
+
+    ``script`` is one of the keys of ``_SCRIPT_BITS`` (case-insensitive).
+    Only the declared ulUnicodeRange bit is consulted; fonts without an OS/2
+    table report False.  For Latin, ``is_latin_font`` additionally checks
+    the code-page range and the cmap.
+    """
+    try:
+        bit = _SCRIPT_BITS[script.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown script {script!r}; expected one of {sorted(_SCRIPT_BITS)}"
+        ) from None
+    ranges = _read_os2_ranges(tt)
+    if ranges is None:
+        return False
+    return bool((ranges[2][bit >> 5] >> (bit & 31)) & 1)
+
+
+# Fallback memo for TTFont objects that refuse new attributes
+_latin_side_cache: "weakref.WeakKeyDictionary[TTFont, bool]" = weakref.WeakKeyDictionary()
 
 
 def is_latin_font(tt: "TTFont") -> bool:
     """
     Determine whether a font supports the Latin script.
 
+    The result is memoized on the font object (``_is_latin_cached``), so
+    repeated calls for the same TTFont cost one attribute read.  See
+    ``_detect_latin`` for the detection strategy.
+    """
+    flag = getattr(tt, "_is_latin_cached", None)
+    if flag is not None:
+        return flag
+    try:
+        return _latin_side_cache[tt]
+    except (KeyError, TypeError):
+        pass
+
+    flag = _detect_latin(tt)
+    try:
+        tt._is_latin_cached = flag
+    except AttributeError:
+        try:
+            _latin_side_cache[tt] = flag
+        except TypeError:
+            pass  # neither attributes nor weak references; don't memoize
+    return flag
+
+
+def _detect_latin(tt: "TTFont") -> bool:
+    """
+    Uncached body of ``is_latin_font``.
+
     Strategy:
-      1. Check OS/2 ulCodePageRange1 bit 0 (Latin 1 / Code Page 1252).
+      1. Check OS/2 ulCodePageRange1 bit 0 (Latin 1 / Code Page 1252) and
+         ulUnicodeRange1 bit 0 (Basic Latin).  An OS/2 table of version 1+
+         that declares other Unicode ranges but neither Latin bit is trusted
+         as a "no".
       2. Fallback: inspect the cmap table for basic Latin codepoints (A-Z, a-z).
     """
-    # Method 1: OS/2 codepage range
+    # Method 1: OS/2 codepage / unicode ranges
     try:
-        os2 = tt.get("OS/2")
-        if os2 is not None:
-            cp_range = getattr(os2, "ulCodePageRange1", 0)
+        ranges = _read_os2_ranges(tt)
+        if ranges is not None:
+            version, cp_range, unicode_ranges = ranges
             if cp_range & 1:  # bit 0 = Latin 1
                 return True
+            if unicode_ranges[0] & 1:  # bit 0 = Basic Latin
+                return True
+            if version >= 1 and any(unicode_ranges):
+                return False
     except Exception:
         pass
 
-    # Method 2: cmap inspection
+    # Method 2: cmap inspection — probe the raw table when it has not been
+    # decompiled yet, otherwise (or if the probe gives up) use getBestCmap.
+    if "cmap" not in getattr(tt, "tables", {}):
+        data = get_table_data(tt, "cmap")
+        if data is not None:
+            try:
+                probed = _probe_latin_cmap(data)
+            except (struct.error, ValueError):
+                probed = None
+            if probed is not None:
+                return probed
+
     try:
         cmap = tt.getBestCmap()
         if cmap is not None:
-            mapped = set(cmap.keys())
-            # Require at least all A-Z and a-z
-            if _REQUIRED_SAMPLE.issubset(mapped):
+            # Require at least all A-Z and a-z.  Non-Latin fonts nearly always
+            # lack 'A', so test it first; the subset test against the keys
+            # view copies nothing and stops at the first missing codepoint.
+            if 0x41 in cmap and _REQUIRED_SAMPLE <= cmap.keys():
                 return True
     except Exception:
         pass